@@ -1,8 +1,11 @@
-from .open_meteo import fetch_model_forecast, fetch_multi_model_comparison
+from ._client import get_client
+from .open_meteo import fetch_model_forecast, fetch_models_combined, fetch_multi_model_comparison
 from .rainviewer import fetch_radar_timestamps, get_radar_tile_url, get_all_radar_frames
 
 __all__ = [
+    "get_client",
     "fetch_model_forecast",
+    "fetch_models_combined",
     "fetch_multi_model_comparison",
     "fetch_radar_timestamps",
     "get_radar_tile_url",
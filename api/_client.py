@@ -0,0 +1,52 @@
+import asyncio
+import atexit
+
+import httpx
+
+USER_AGENT = "weather-app/1.0"
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared pooled HTTP client for the running event loop.
+
+    httpx connections are bound to the loop that opened them, so a new client
+    is created whenever the caller runs on a different loop than the cached one.
+    Within a loop every request reuses the same keep-alive connections, and
+    HTTP/2 multiplexes concurrent requests to one host over a single socket.
+    Brotli is negotiated automatically because the brotli extra is installed.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(30.0),
+            headers={"User-Agent": USER_AGENT},
+            http2=True,
+        )
+        _client_loop = loop
+    return _client
+
+
+def _close_client() -> None:
+    """Close the shared client at interpreter exit if its loop is still usable."""
+    if _client is None or _client.is_closed or _client_loop is None:
+        return
+    if _client_loop.is_closed():
+        return
+    if _client_loop.is_running():
+        # The loop lives in a background thread (see dashboard.get_event_loop)
+        asyncio.run_coroutine_threadsafe(_client.aclose(), _client_loop).result(timeout=5)
+    else:
+        _client_loop.run_until_complete(_client.aclose())
+
+
+atexit.register(_close_client)
@@ -1,9 +1,26 @@
 from typing import Any
 
-import httpx
+import orjson
+
+from ._client import get_client
 
 OPEN_METEO_BASE = "https://api.open-meteo.com/v1/forecast"
 
+DEFAULT_VARIABLES = (
+    "temperature_2m",
+    "relative_humidity_2m",
+    "precipitation",
+    "wind_speed_10m",
+    "wind_direction_10m",
+    "weather_code",
+)
+
+# Open-Meteo model identifiers mapped to the short keys used by the charts
+MODEL_KEYS = {
+    "gfs_seamless": "gfs",
+    "ecmwf_ifs": "ecmwf",
+}
+
 
 async def fetch_model_forecast(
     latitude: float,
@@ -24,14 +41,7 @@ async def fetch_model_forecast(
         API response dict or None on error
     """
     if variables is None:
-        variables = [
-            "temperature_2m",
-            "relative_humidity_2m",
-            "precipitation",
-            "wind_speed_10m",
-            "wind_direction_10m",
-            "weather_code",
-        ]
+        variables = DEFAULT_VARIABLES
 
     params = {
         "latitude": latitude,
@@ -42,13 +52,73 @@ async def fetch_model_forecast(
         "forecast_days": 7,
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(OPEN_METEO_BASE, params=params, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except Exception:
-            return None
+    client = get_client()
+    try:
+        response = await client.get(OPEN_METEO_BASE, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except Exception:
+        return None
+
+
+def _split_models(data: dict[str, Any], models: tuple[str, ...]) -> dict[str, dict[str, Any] | None]:
+    """
+    Split a multi-model Open-Meteo response into one response per model.
+
+    Open-Meteo suffixes every hourly key with the model name when several models
+    are requested (e.g. "temperature_2m_gfs_seamless"). Each returned dict has the
+    same shape as a single-model response, or is None if the model had no data.
+    """
+    hourly = data.get("hourly", {})
+    units = data.get("hourly_units", {})
+    meta = {key: value for key, value in data.items() if key not in ("hourly", "hourly_units")}
+
+    split: dict[str, dict[str, Any] | None] = {}
+    for model in models:
+        suffix = f"_{model}"
+        model_hourly = {
+            key.removesuffix(suffix): values for key, values in hourly.items() if key.endswith(suffix)
+        }
+        if not model_hourly:
+            split[model] = None
+            continue
+
+        model_units = {key.removesuffix(suffix): unit for key, unit in units.items() if key.endswith(suffix)}
+        split[model] = {
+            **meta,
+            "hourly_units": {"time": units.get("time"), **model_units},
+            "hourly": {"time": hourly.get("time", []), **model_hourly},
+        }
+
+    return split
+
+
+async def fetch_models_combined(
+    latitude: float,
+    longitude: float,
+    models: tuple[str, ...] = ("gfs_seamless", "ecmwf_ifs"),
+    variables: list[str] | None = None,
+) -> dict[str, dict[str, Any] | None]:
+    """
+    Fetch forecasts for several models from Open-Meteo in a single request.
+
+    Args:
+        latitude: Location latitude
+        longitude: Location longitude
+        models: Open-Meteo model identifiers to request
+        variables: List of weather variables to fetch
+
+    Returns:
+        Dict keyed by model identifier with single-model responses (None on error)
+    """
+    if len(models) == 1:
+        return {models[0]: await fetch_model_forecast(latitude, longitude, models[0], variables)}
+
+    data = await fetch_model_forecast(latitude, longitude, ",".join(models), variables)
+    if not data:
+        return dict.fromkeys(models)
+
+    return _split_models(data, models)
 
 
 async def fetch_multi_model_comparison(
@@ -62,10 +132,6 @@ async def fetch_multi_model_comparison(
     Returns:
         Dict with "gfs" and "ecmwf" keys containing respective forecasts
     """
-    gfs_data = await fetch_model_forecast(latitude, longitude, "gfs_seamless", variables)
-    ecmwf_data = await fetch_model_forecast(latitude, longitude, "ecmwf_ifs", variables)
+    forecasts = await fetch_models_combined(latitude, longitude, tuple(MODEL_KEYS), variables)
 
-    return {
-        "gfs": gfs_data,
-        "ecmwf": ecmwf_data,
-    }
+    return {MODEL_KEYS[model]: data for model, data in forecasts.items()}
@@ -1,8 +1,14 @@
 from typing import Any
 
-import httpx
+import orjson
+
+from ._client import get_client
 
 RAINVIEWER_API = "https://api.rainviewer.com/public/weather-maps.json"
+DEFAULT_TILE_HOST = "https://tilecache.rainviewer.com"
+
+# Every frame shares this suffix; only the host and frame path vary
+TILE_SUFFIX = "/256/{z}/{x}/{y}/2/1_1.png"
 
 
 async def fetch_radar_timestamps() -> dict[str, Any] | None:
@@ -12,13 +18,13 @@ async def fetch_radar_timestamps() -> dict[str, Any] | None:
     Returns:
         API response with radar frame timestamps and tile URLs
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(RAINVIEWER_API, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except Exception:
-            return None
+    client = get_client()
+    try:
+        response = await client.get(RAINVIEWER_API)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except Exception:
+        return None
 
 
 def get_radar_tile_url(radar_data: dict, frame_index: int = -1) -> str | None:
@@ -38,32 +44,23 @@ def get_radar_tile_url(radar_data: dict, frame_index: int = -1) -> str | None:
             return None
 
         frame = radar_frames[frame_index]
-        path = frame["path"]
-        host = radar_data.get("host", "https://tilecache.rainviewer.com")
+        host = radar_data.get("host", DEFAULT_TILE_HOST)
 
-        return f"{host}{path}/256/{{z}}/{{x}}/{{y}}/2/1_1.png"
+        return host + frame["path"] + TILE_SUFFIX
     except (KeyError, IndexError):
         return None
 
 
-def get_all_radar_frames(radar_data: dict) -> list[dict]:
+def get_all_radar_frames(radar_data: dict) -> tuple[tuple[int, str], ...]:
     """
     Get all available radar frames with timestamps and tile URLs.
 
     Returns:
-        List of dicts with 'time' (unix timestamp) and 'url' keys
+        Tuple of (unix timestamp, tile URL) pairs, oldest first
     """
-    frames = []
     try:
-        host = radar_data.get("host", "https://tilecache.rainviewer.com")
+        prefix = radar_data.get("host", DEFAULT_TILE_HOST)
         radar_frames = radar_data.get("radar", {}).get("past", [])
-
-        for frame in radar_frames:
-            path = frame["path"]
-            time = frame["time"]
-            url = f"{host}{path}/256/{{z}}/{{x}}/{{y}}/2/1_1.png"
-            frames.append({"time": time, "url": url})
+        return tuple((frame["time"], prefix + frame["path"] + TILE_SUFFIX) for frame in radar_frames)
     except (KeyError, TypeError):
-        pass
-
-    return frames
+        return ()
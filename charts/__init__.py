@@ -3,6 +3,7 @@ from .model_comparison import (
     create_precipitation_comparison_chart,
     create_wind_comparison_chart,
     create_multi_variable_dashboard,
+    prepare_series,
 )
 
 __all__ = [
@@ -10,4 +11,5 @@ __all__ = [
     "create_precipitation_comparison_chart",
     "create_wind_comparison_chart",
     "create_multi_variable_dashboard",
+    "prepare_series",
 ]
@@ -1,8 +1,84 @@
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Hourly variables plotted by the comparison charts
+HOURLY_SERIES = ("temperature_2m", "precipitation", "wind_speed_10m", "relative_humidity_2m")
+
+# Line traces longer than this are down-sampled with LTTB before plotting
+MAX_LINE_POINTS = 800
+
+
+def _arr(values: list, dtype: type = np.float32) -> np.ndarray:
+    """Convert a decoded JSON list into a typed array (None becomes NaN)."""
+    return np.asarray(values, dtype=dtype)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick n_out indices using Largest-Triangle-Three-Buckets down-sampling.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves peaks and troughs.
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    xf = (x.view(np.int64) if x.dtype.kind == "M" else x).astype(np.float64)
+    yf = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = xf[next_lo:next_hi].mean()
+        avg_y = yf[next_lo:next_hi].mean()
+
+        area = np.abs((xf[a] - avg_x) * (yf[lo:hi] - yf[a]) - (xf[a] - xf[lo:hi]) * (avg_y - yf[a]))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[i + 1] = a
+
+    return selected
+
+
+def _line_data(series: dict[str, np.ndarray], key: str) -> dict[str, np.ndarray]:
+    """Return x/y arrays for a line trace, down-sampled when the series is long."""
+    x, y = series["time"], series[key]
+    if len(y) > MAX_LINE_POINTS:
+        keep = _lttb_indices(x, y, MAX_LINE_POINTS)
+        x, y = x[keep], y[keep]
+    return {"x": x, "y": y}
+
+
+def prepare_series(data: dict[str, Any] | None) -> dict[str, np.ndarray] | None:
+    """
+    Convert the hourly block of an Open-Meteo response into NumPy arrays.
+
+    Plotly serializes typed arrays directly instead of validating every list
+    element. Chart builders accept either a raw response or the output of this
+    function, so callers drawing several charts can convert the data once.
+    """
+    if not data:
+        return None
+    if "hourly" not in data:
+        # Already prepared, or a response without hourly data
+        return data if "time" in data else None
+
+    hourly = data["hourly"]
+    prepared = {"time": pd.to_datetime(hourly["time"]).values}
+    for key in HOURLY_SERIES:
+        if key in hourly:
+            prepared[key] = _arr(hourly[key])
+    return prepared
+
 
 def create_temperature_comparison_chart(
     gfs_data: dict[str, Any] | None,
@@ -10,23 +86,22 @@ def create_temperature_comparison_chart(
 ) -> go.Figure:
     """Create a Plotly chart comparing temperature forecasts between models."""
     fig = go.Figure()
+    gfs, ecmwf = prepare_series(gfs_data), prepare_series(ecmwf_data)
 
-    if gfs_data and "hourly" in gfs_data:
+    if gfs is not None:
         fig.add_trace(
-            go.Scatter(
-                x=gfs_data["hourly"]["time"],
-                y=gfs_data["hourly"]["temperature_2m"],
+            go.Scattergl(
+                **_line_data(gfs, "temperature_2m"),
                 mode="lines",
                 name="GFS",
                 line=dict(color="#1f77b4", width=2),
             )
         )
 
-    if ecmwf_data and "hourly" in ecmwf_data:
+    if ecmwf is not None:
         fig.add_trace(
-            go.Scatter(
-                x=ecmwf_data["hourly"]["time"],
-                y=ecmwf_data["hourly"]["temperature_2m"],
+            go.Scattergl(
+                **_line_data(ecmwf, "temperature_2m"),
                 mode="lines",
                 name="ECMWF",
                 line=dict(color="#ff7f0e", width=2),
@@ -50,23 +125,24 @@ def create_precipitation_comparison_chart(
 ) -> go.Figure:
     """Create a Plotly chart comparing precipitation forecasts between models."""
     fig = go.Figure()
+    gfs, ecmwf = prepare_series(gfs_data), prepare_series(ecmwf_data)
 
-    if gfs_data and "hourly" in gfs_data:
+    if gfs is not None:
         fig.add_trace(
             go.Bar(
-                x=gfs_data["hourly"]["time"],
-                y=gfs_data["hourly"]["precipitation"],
+                x=gfs["time"],
+                y=gfs["precipitation"],
                 name="GFS",
                 marker_color="#1f77b4",
                 opacity=0.7,
             )
         )
 
-    if ecmwf_data and "hourly" in ecmwf_data:
+    if ecmwf is not None:
         fig.add_trace(
             go.Bar(
-                x=ecmwf_data["hourly"]["time"],
-                y=ecmwf_data["hourly"]["precipitation"],
+                x=ecmwf["time"],
+                y=ecmwf["precipitation"],
                 name="ECMWF",
                 marker_color="#ff7f0e",
                 opacity=0.7,
@@ -91,12 +167,12 @@ def create_wind_comparison_chart(
 ) -> go.Figure:
     """Create a Plotly chart comparing wind speed forecasts between models."""
     fig = go.Figure()
+    gfs, ecmwf = prepare_series(gfs_data), prepare_series(ecmwf_data)
 
-    if gfs_data and "hourly" in gfs_data:
+    if gfs is not None:
         fig.add_trace(
-            go.Scatter(
-                x=gfs_data["hourly"]["time"],
-                y=gfs_data["hourly"]["wind_speed_10m"],
+            go.Scattergl(
+                **_line_data(gfs, "wind_speed_10m"),
                 mode="lines",
                 name="GFS",
                 line=dict(color="#1f77b4", width=2),
@@ -105,11 +181,10 @@ def create_wind_comparison_chart(
             )
         )
 
-    if ecmwf_data and "hourly" in ecmwf_data:
+    if ecmwf is not None:
         fig.add_trace(
-            go.Scatter(
-                x=ecmwf_data["hourly"]["time"],
-                y=ecmwf_data["hourly"]["wind_speed_10m"],
+            go.Scattergl(
+                **_line_data(ecmwf, "wind_speed_10m"),
                 mode="lines",
                 name="ECMWF",
                 line=dict(color="#ff7f0e", width=2),
@@ -146,123 +221,144 @@ def create_multi_variable_dashboard(
         vertical_spacing=0.12,
         horizontal_spacing=0.1,
     )
+    gfs, ecmwf = prepare_series(gfs_data), prepare_series(ecmwf_data)
+
+    # (trace, row, col) tuples, added in one add_traces call so Plotly
+    # validates and lays out the subplot grid once instead of per trace
+    traces: list[tuple[go.Scattergl | go.Bar, int, int]] = []
 
     # Temperature (row 1, col 1)
-    if gfs_data and "hourly" in gfs_data:
-        fig.add_trace(
-            go.Scatter(
-                x=gfs_data["hourly"]["time"],
-                y=gfs_data["hourly"]["temperature_2m"],
-                mode="lines",
-                name="GFS",
-                line=dict(color="#1f77b4"),
-                showlegend=True,
-            ),
-            row=1,
-            col=1,
+    if gfs is not None:
+        traces.append(
+            (
+                go.Scattergl(
+                    **_line_data(gfs, "temperature_2m"),
+                    mode="lines",
+                    name="GFS",
+                    line=dict(color="#1f77b4"),
+                    showlegend=True,
+                ),
+                1,
+                1,
+            )
         )
 
-    if ecmwf_data and "hourly" in ecmwf_data:
-        fig.add_trace(
-            go.Scatter(
-                x=ecmwf_data["hourly"]["time"],
-                y=ecmwf_data["hourly"]["temperature_2m"],
-                mode="lines",
-                name="ECMWF",
-                line=dict(color="#ff7f0e"),
-                showlegend=True,
-            ),
-            row=1,
-            col=1,
+    if ecmwf is not None:
+        traces.append(
+            (
+                go.Scattergl(
+                    **_line_data(ecmwf, "temperature_2m"),
+                    mode="lines",
+                    name="ECMWF",
+                    line=dict(color="#ff7f0e"),
+                    showlegend=True,
+                ),
+                1,
+                1,
+            )
         )
 
     # Precipitation (row 1, col 2)
-    if gfs_data and "hourly" in gfs_data:
-        fig.add_trace(
-            go.Bar(
-                x=gfs_data["hourly"]["time"],
-                y=gfs_data["hourly"]["precipitation"],
-                name="GFS Precip",
-                marker_color="#1f77b4",
-                opacity=0.7,
-                showlegend=False,
-            ),
-            row=1,
-            col=2,
+    if gfs is not None:
+        traces.append(
+            (
+                go.Bar(
+                    x=gfs["time"],
+                    y=gfs["precipitation"],
+                    name="GFS Precip",
+                    marker_color="#1f77b4",
+                    opacity=0.7,
+                    showlegend=False,
+                ),
+                1,
+                2,
+            )
         )
 
-    if ecmwf_data and "hourly" in ecmwf_data:
-        fig.add_trace(
-            go.Bar(
-                x=ecmwf_data["hourly"]["time"],
-                y=ecmwf_data["hourly"]["precipitation"],
-                name="ECMWF Precip",
-                marker_color="#ff7f0e",
-                opacity=0.7,
-                showlegend=False,
-            ),
-            row=1,
-            col=2,
+    if ecmwf is not None:
+        traces.append(
+            (
+                go.Bar(
+                    x=ecmwf["time"],
+                    y=ecmwf["precipitation"],
+                    name="ECMWF Precip",
+                    marker_color="#ff7f0e",
+                    opacity=0.7,
+                    showlegend=False,
+                ),
+                1,
+                2,
+            )
         )
 
     # Wind Speed (row 2, col 1)
-    if gfs_data and "hourly" in gfs_data:
-        fig.add_trace(
-            go.Scatter(
-                x=gfs_data["hourly"]["time"],
-                y=gfs_data["hourly"]["wind_speed_10m"],
-                mode="lines",
-                name="GFS Wind",
-                line=dict(color="#1f77b4"),
-                showlegend=False,
-            ),
-            row=2,
-            col=1,
+    if gfs is not None:
+        traces.append(
+            (
+                go.Scattergl(
+                    **_line_data(gfs, "wind_speed_10m"),
+                    mode="lines",
+                    name="GFS Wind",
+                    line=dict(color="#1f77b4"),
+                    showlegend=False,
+                ),
+                2,
+                1,
+            )
         )
 
-    if ecmwf_data and "hourly" in ecmwf_data:
-        fig.add_trace(
-            go.Scatter(
-                x=ecmwf_data["hourly"]["time"],
-                y=ecmwf_data["hourly"]["wind_speed_10m"],
-                mode="lines",
-                name="ECMWF Wind",
-                line=dict(color="#ff7f0e"),
-                showlegend=False,
-            ),
-            row=2,
-            col=1,
+    if ecmwf is not None:
+        traces.append(
+            (
+                go.Scattergl(
+                    **_line_data(ecmwf, "wind_speed_10m"),
+                    mode="lines",
+                    name="ECMWF Wind",
+                    line=dict(color="#ff7f0e"),
+                    showlegend=False,
+                ),
+                2,
+                1,
+            )
         )
 
     # Humidity (row 2, col 2)
-    if gfs_data and "hourly" in gfs_data:
-        fig.add_trace(
-            go.Scatter(
-                x=gfs_data["hourly"]["time"],
-                y=gfs_data["hourly"]["relative_humidity_2m"],
-                mode="lines",
-                name="GFS Humidity",
-                line=dict(color="#1f77b4"),
-                showlegend=False,
-            ),
-            row=2,
-            col=2,
+    if gfs is not None:
+        traces.append(
+            (
+                go.Scattergl(
+                    **_line_data(gfs, "relative_humidity_2m"),
+                    mode="lines",
+                    name="GFS Humidity",
+                    line=dict(color="#1f77b4"),
+                    showlegend=False,
+                ),
+                2,
+                2,
+            )
         )
 
-    if ecmwf_data and "hourly" in ecmwf_data:
-        fig.add_trace(
-            go.Scatter(
-                x=ecmwf_data["hourly"]["time"],
-                y=ecmwf_data["hourly"]["relative_humidity_2m"],
-                mode="lines",
-                name="ECMWF Humidity",
-                line=dict(color="#ff7f0e"),
-                showlegend=False,
-            ),
-            row=2,
-            col=2,
+    if ecmwf is not None:
+        traces.append(
+            (
+                go.Scattergl(
+                    **_line_data(ecmwf, "relative_humidity_2m"),
+                    mode="lines",
+                    name="ECMWF Humidity",
+                    line=dict(color="#ff7f0e"),
+                    showlegend=False,
+                ),
+                2,
+                2,
+            )
         )
 
+    fig.add_traces(
+        [trace for trace, _, _ in traces],
+        rows=[row for _, row, _ in traces],
+        cols=[col for _, _, col in traces],
+    )
+
     fig.update_layout(
         height=600,
         title_text="Weather Model Comparison Dashboard",
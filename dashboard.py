@@ -1,24 +1,51 @@
 import asyncio
+import threading
+import types
+from collections.abc import Coroutine
 from datetime import datetime
 from typing import Any
 
-import httpx
+import folium
+import orjson
+import pandas as pd
+import plotly.graph_objects as go
 import streamlit as st
+import streamlit.components.v1 as components
 from streamlit_folium import st_folium
 
-from api import fetch_multi_model_comparison, fetch_radar_timestamps, get_all_radar_frames
+from api import fetch_multi_model_comparison, fetch_radar_timestamps, get_all_radar_frames, get_client
 from charts import (
     create_multi_variable_dashboard,
     create_precipitation_comparison_chart,
     create_temperature_comparison_chart,
     create_wind_comparison_chart,
+    prepare_series,
+)
+from maps import (
+    create_forecast_map,
+    create_location_picker_map,
+    create_radar_map,
+    create_radar_overlay,
+    get_alerts_map_html,
 )
-from maps import create_alerts_map, create_forecast_map, create_location_picker_map, create_radar_map
 
 NWS_API_BASE = "https://api.weather.gov"
-USER_AGENT = "weather-app/1.0"
 
-US_STATES = {
+# Coordinates are rounded before caching so nearby clicks share cache entries
+COORD_PRECISION = 2
+
+# Upper bound on how long a button handler waits for its network calls
+FETCH_TIMEOUT = 45.0
+
+MODEL_CHARTS = {
+    "Dashboard": create_multi_variable_dashboard,
+    "Temperature": create_temperature_comparison_chart,
+    "Precipitation": create_precipitation_comparison_chart,
+    "Wind": create_wind_comparison_chart,
+}
+VARIABLE_CHARTS = ("Temperature", "Precipitation", "Wind")
+
+US_STATES = types.MappingProxyType({
     "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
     "CA": "California", "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware",
     "FL": "Florida", "GA": "Georgia", "HI": "Hawaii", "ID": "Idaho",
@@ -32,7 +59,8 @@ US_STATES = {
     "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah",
     "VT": "Vermont", "VA": "Virginia", "WA": "Washington", "WV": "West Virginia",
     "WI": "Wisconsin", "WY": "Wyoming",
-}
+})
+US_STATE_CODES = tuple(US_STATES)
 
 
 def is_new_click(click_data: dict | None, last_click_key: str) -> bool:
@@ -50,14 +78,14 @@ def is_new_click(click_data: dict | None, last_click_key: str) -> bool:
 
 
 async def make_nws_request(url: str) -> dict[str, Any] | None:
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/geo+json"}
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except Exception:
-            return None
+    headers = {"Accept": "application/geo+json"}
+    client = get_client()
+    try:
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except Exception:
+        return None
 
 
 async def fetch_alerts(state: str) -> list[dict] | None:
@@ -68,18 +96,108 @@ async def fetch_alerts(state: str) -> list[dict] | None:
     return data["features"]
 
 
-async def fetch_forecast(latitude: float, longitude: float) -> list[dict] | None:
-    points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
-    points_data = await make_nws_request(points_url)
+class FetchError(Exception):
+    """Raised inside cached loaders so that failed fetches are not memoized."""
+
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Start the background event loop shared by every session for network I/O."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="weather-io", daemon=True).start()
+    return loop
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine on the shared background loop and wait for its result.
+
+    Keeping one long-lived loop lets the pooled HTTP client keep its
+    connections open between clicks instead of losing them with each loop.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+    try:
+        return future.result(timeout=FETCH_TIMEOUT)
+    except TimeoutError as exc:
+        future.cancel()
+        raise FetchError("Timed out waiting for the weather APIs") from exc
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_alerts(state: str) -> list[dict]:
+    """Fetch active alerts for a state, cached for one minute."""
+    alerts = run_async(fetch_alerts(state))
+    if alerts is None:
+        raise FetchError(f"Unable to fetch alerts for {state}")
+    return alerts
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def resolve_forecast_url(latitude: float, longitude: float) -> str:
+    """Resolve the NWS gridpoint forecast URL for a location, cached for a day."""
+    points_data = run_async(make_nws_request(f"{NWS_API_BASE}/points/{latitude},{longitude}"))
     if not points_data:
-        return None
-    forecast_url = points_data["properties"]["forecast"]
-    forecast_data = await make_nws_request(forecast_url)
+        raise FetchError(f"Unable to resolve NWS gridpoint for {latitude}, {longitude}")
+    return points_data["properties"]["forecast"]
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_forecast(latitude: float, longitude: float) -> list[dict]:
+    """Fetch NWS forecast periods for a location, cached for ten minutes."""
+    forecast_data = run_async(make_nws_request(resolve_forecast_url(latitude, longitude)))
     if not forecast_data:
-        return None
+        # The gridpoint may be stale; resolve it again on the next attempt
+        resolve_forecast_url.clear(latitude, longitude)
+        raise FetchError(f"Unable to fetch forecast for {latitude}, {longitude}")
     return forecast_data["properties"]["periods"]
 
 
+@st.cache_data(ttl=600, show_spinner=False)
+def load_model_comparison(latitude: float, longitude: float) -> dict[str, dict | None]:
+    """Fetch GFS and ECMWF forecasts for a location, cached for ten minutes."""
+    model_data = run_async(fetch_multi_model_comparison(latitude, longitude))
+    if not model_data.get("gfs") and not model_data.get("ecmwf"):
+        raise FetchError(f"Unable to fetch model data for {latitude}, {longitude}")
+    return model_data
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def load_radar_frames() -> tuple[tuple[int, str], ...]:
+    """Fetch RainViewer frames with their tile URLs, cached for two minutes."""
+    radar_data = run_async(fetch_radar_timestamps())
+    if not radar_data:
+        raise FetchError("Unable to fetch radar data")
+    return get_all_radar_frames(radar_data)
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def build_model_chart(
+    chart: str,
+    gfs_series: dict[str, Any] | None,
+    ecmwf_series: dict[str, Any] | None,
+) -> go.Figure:
+    """Build a model comparison figure, reused until the forecast data changes."""
+    return MODEL_CHARTS[chart](gfs_series, ecmwf_series)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def cached_location_picker_map(
+    center_lat: float,
+    center_lon: float,
+    zoom: int,
+    selected_lat: float,
+    selected_lon: float,
+) -> folium.Map:
+    """Build a location picker map once per center, zoom and selected point."""
+    return create_location_picker_map(
+        center_lat=center_lat,
+        center_lon=center_lon,
+        zoom=zoom,
+        selected_lat=selected_lat,
+        selected_lon=selected_lon,
+    )
+
+
 # Initialize session state for selected locations
 if "forecast_lat" not in st.session_state:
     st.session_state.forecast_lat = 40.7128
@@ -104,13 +222,16 @@ with tab1:
     st.header("Weather Alerts by State")
     state_code = st.selectbox(
         "Select a state",
-        options=list(US_STATES.keys()),
+        options=US_STATE_CODES,
         format_func=lambda x: f"{US_STATES[x]} ({x})",
     )
 
     if st.button("Get Alerts", key="alerts_btn"):
         with st.spinner("Fetching alerts..."):
-            alerts = asyncio.run(fetch_alerts(state_code))
+            try:
+                alerts = load_alerts(state_code)
+            except FetchError:
+                alerts = None
 
         if alerts is None:
             st.error("Unable to fetch alerts. Please try again.")
@@ -121,8 +242,9 @@ with tab1:
 
             col_map, col_list = st.columns([2, 1])
             with col_map:
-                alerts_map = create_alerts_map(alerts, state_code)
-                st_folium(alerts_map, width=700, height=500, returned_objects=[])
+                # The alerts map is display-only, so cached HTML is embedded directly
+                # instead of round-tripping a folium.Map through st_folium
+                components.html(get_alerts_map_html(state_code, alerts), width=700, height=500)
 
             with col_list:
                 for alert in alerts:
@@ -130,21 +252,28 @@ with tab1:
                     with st.expander(
                         f"{props.get('event', 'Unknown Event')} - {props.get('severity', 'Unknown')}"
                     ):
-                        st.markdown(f"**Area:** {props.get('areaDesc', 'Unknown')}")
-                        st.markdown(f"**Severity:** {props.get('severity', 'Unknown')}")
-                        st.markdown(f"**Description:**\n{props.get('description', 'No description')}")
+                        # One markdown element per alert keeps the widget count down
+                        details = [
+                            f"**Area:** {props.get('areaDesc', 'Unknown')}",
+                            f"**Severity:** {props.get('severity', 'Unknown')}",
+                            f"**Description:**\n{props.get('description', 'No description')}",
+                        ]
                         if props.get("instruction"):
-                            st.markdown(f"**Instructions:**\n{props.get('instruction')}")
+                            details.append(f"**Instructions:**\n{props.get('instruction')}")
+                        st.markdown("\n\n".join(details))
+
 
 # Tab 2: Forecast
-with tab2:
+@st.fragment
+def forecast_tab() -> None:
+    """Render the forecast tab; its widgets rerun only this fragment."""
     st.header("Weather Forecast")
     st.markdown("**Click on the map to select a location**, or enter coordinates manually.")
 
     col_map, col_controls = st.columns([2, 1])
 
     with col_map:
-        forecast_picker = create_location_picker_map(
+        forecast_picker = cached_location_picker_map(
             center_lat=st.session_state.forecast_lat,
             center_lon=st.session_state.forecast_lon,
             zoom=5,
@@ -162,7 +291,7 @@ with tab2:
             clicked = map_data["last_clicked"]
             st.session_state.forecast_lat = clicked["lat"]
             st.session_state.forecast_lon = clicked["lng"]
-            st.rerun()
+            st.rerun(scope="fragment")
 
     with col_controls:
         st.subheader("Selected Location")
@@ -185,15 +314,19 @@ with tab2:
                 st.session_state.forecast_lat = new_lat
                 st.session_state.forecast_lon = new_lon
                 st.session_state.forecast_last_click = (new_lat, new_lon)
-                st.rerun()
+                st.rerun(scope="fragment")
 
         st.caption("NWS forecasts only work for US locations")
 
         if st.button("Get Forecast", key="forecast_btn", type="primary"):
             with st.spinner("Fetching forecast..."):
-                periods = asyncio.run(
-                    fetch_forecast(st.session_state.forecast_lat, st.session_state.forecast_lon)
-                )
+                try:
+                    periods = load_forecast(
+                        round(st.session_state.forecast_lat, COORD_PRECISION),
+                        round(st.session_state.forecast_lon, COORD_PRECISION),
+                    )
+                except FetchError:
+                    periods = None
 
             if periods is None:
                 st.error("Unable to fetch forecast. Make sure coordinates are within the US.")
@@ -203,28 +336,46 @@ with tab2:
     if "forecast_data" in st.session_state and st.session_state.forecast_data:
         st.divider()
         st.subheader(f"Forecast for ({st.session_state.forecast_lat:.4f}, {st.session_state.forecast_lon:.4f})")
-        for period in st.session_state.forecast_data[:5]:
-            with st.container():
-                col1, col2 = st.columns([1, 3])
-                with col1:
-                    st.metric(
-                        label=period["name"],
-                        value=f"{period['temperature']}°{period['temperatureUnit']}",
-                        delta=f"{period['windSpeed']} {period['windDirection']}",
-                    )
-                with col2:
-                    st.write(period["detailedForecast"])
-                st.divider()
+        current, *upcoming = st.session_state.forecast_data[:5]
+
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            st.metric(
+                label=current["name"],
+                value=f"{current['temperature']}°{current['temperatureUnit']}",
+                delta=f"{current['windSpeed']} {current['windDirection']}",
+            )
+        with col2:
+            st.write(current["detailedForecast"])
+
+        # Later periods go into one table instead of a metric/columns/divider set each
+        if upcoming:
+            upcoming_df = pd.DataFrame(
+                {
+                    "Period": [period["name"] for period in upcoming],
+                    "Temperature": [f"{period['temperature']}°{period['temperatureUnit']}" for period in upcoming],
+                    "Wind": [f"{period['windSpeed']} {period['windDirection']}" for period in upcoming],
+                    "Forecast": [period["detailedForecast"] for period in upcoming],
+                }
+            )
+            st.dataframe(upcoming_df, hide_index=True, use_container_width=True)
+
+
+with tab2:
+    forecast_tab()
+
 
 # Tab 3: Model Comparison
-with tab3:
+@st.fragment
+def model_comparison_tab() -> None:
+    """Render the model comparison tab; its widgets rerun only this fragment."""
     st.header("Weather Model Comparison")
     st.markdown("Compare **GFS** (US) and **ECMWF** (European) models. **Click the map to select a location.**")
 
     col_map, col_controls = st.columns([2, 1])
 
     with col_map:
-        model_picker = create_location_picker_map(
+        model_picker = cached_location_picker_map(
             center_lat=st.session_state.model_lat,
             center_lon=st.session_state.model_lon,
             zoom=4,
@@ -242,7 +393,7 @@ with tab3:
             clicked = map_data["last_clicked"]
             st.session_state.model_lat = clicked["lat"]
             st.session_state.model_lon = clicked["lng"]
-            st.rerun()
+            st.rerun(scope="fragment")
 
     with col_controls:
         st.subheader("Selected Location")
@@ -265,51 +416,57 @@ with tab3:
                 st.session_state.model_lat = new_lat
                 st.session_state.model_lon = new_lon
                 st.session_state.model_last_click = (new_lat, new_lon)
-                st.rerun()
+                st.rerun(scope="fragment")
 
         st.caption("Data from Open-Meteo API (works globally)")
 
         if st.button("Compare Models", key="compare_btn", type="primary"):
             with st.spinner("Fetching model data from GFS and ECMWF..."):
-                model_data = asyncio.run(
-                    fetch_multi_model_comparison(st.session_state.model_lat, st.session_state.model_lon)
-                )
-
-            gfs_data = model_data.get("gfs")
-            ecmwf_data = model_data.get("ecmwf")
+                try:
+                    model_data = load_model_comparison(
+                        round(st.session_state.model_lat, COORD_PRECISION),
+                        round(st.session_state.model_lon, COORD_PRECISION),
+                    )
+                except FetchError:
+                    model_data = None
 
-            if not gfs_data and not ecmwf_data:
+            if model_data is None:
                 st.error("Unable to fetch model data. Please try again.")
             else:
-                st.session_state.gfs_data = gfs_data
-                st.session_state.ecmwf_data = ecmwf_data
+                # Converted once per fetch; charts are cached on these arrays
+                st.session_state.gfs_series = prepare_series(model_data.get("gfs"))
+                st.session_state.ecmwf_series = prepare_series(model_data.get("ecmwf"))
 
-    if "gfs_data" in st.session_state or "ecmwf_data" in st.session_state:
-        gfs_data = st.session_state.get("gfs_data")
-        ecmwf_data = st.session_state.get("ecmwf_data")
+    if "gfs_series" in st.session_state or "ecmwf_series" in st.session_state:
+        gfs_series = st.session_state.get("gfs_series")
+        ecmwf_series = st.session_state.get("ecmwf_series")
 
-        if gfs_data or ecmwf_data:
+        if gfs_series is not None or ecmwf_series is not None:
             st.divider()
             st.subheader("Multi-Variable Dashboard")
-            dashboard_fig = create_multi_variable_dashboard(gfs_data, ecmwf_data)
+            dashboard_fig = build_model_chart("Dashboard", gfs_series, ecmwf_series)
             st.plotly_chart(dashboard_fig, use_container_width=True)
 
-            var_tab1, var_tab2, var_tab3 = st.tabs(["Temperature", "Precipitation", "Wind"])
+            # Only the selected chart is built; hidden st.tabs would build all three
+            variable = st.radio(
+                "Variable",
+                options=VARIABLE_CHARTS,
+                horizontal=True,
+                label_visibility="collapsed",
+                key="model_variable",
+            )
+            variable_fig = build_model_chart(variable, gfs_series, ecmwf_series)
+            st.plotly_chart(variable_fig, use_container_width=True)
 
-            with var_tab1:
-                temp_fig = create_temperature_comparison_chart(gfs_data, ecmwf_data)
-                st.plotly_chart(temp_fig, use_container_width=True)
 
-            with var_tab2:
-                precip_fig = create_precipitation_comparison_chart(gfs_data, ecmwf_data)
-                st.plotly_chart(precip_fig, use_container_width=True)
+with tab3:
+    model_comparison_tab()
 
-            with var_tab3:
-                wind_fig = create_wind_comparison_chart(gfs_data, ecmwf_data)
-                st.plotly_chart(wind_fig, use_container_width=True)
 
 # Tab 4: Radar
-with tab4:
+@st.fragment
+def radar_tab() -> None:
+    """Render the radar tab; its widgets rerun only this fragment."""
     st.header("Live Radar")
     st.markdown("**Click on the map to recenter.** Radar imagery powered by RainViewer.")
 
@@ -339,19 +496,22 @@ with tab4:
                 st.session_state.radar_lat = new_lat
                 st.session_state.radar_lon = new_lon
                 st.session_state.radar_last_click = (new_lat, new_lon)
-                st.rerun()
+                st.rerun(scope="fragment")
 
     with col_zoom:
         radar_zoom = st.slider("Zoom Level", min_value=3, max_value=10, value=5)
 
     if st.button("Load Radar", key="radar_btn", type="primary"):
         with st.spinner("Fetching radar data..."):
-            radar_data = asyncio.run(fetch_radar_timestamps())
+            try:
+                radar_frames = load_radar_frames()
+            except FetchError:
+                radar_frames = None
 
-        if not radar_data:
+        if radar_frames is None:
             st.error("Unable to fetch radar data. Please try again.")
         else:
-            st.session_state.radar_frames = get_all_radar_frames(radar_data)
+            st.session_state.radar_frames = radar_frames
 
     if "radar_frames" in st.session_state and st.session_state.radar_frames:
         frames = st.session_state.radar_frames
@@ -364,23 +524,28 @@ with tab4:
             key="radar_frame_slider",
         )
 
-        selected_frame = frames[frame_idx]
-        frame_time = datetime.fromtimestamp(selected_frame["time"])
+        frame_timestamp, frame_url = frames[frame_idx]
+        frame_time = datetime.fromtimestamp(frame_timestamp)
         st.caption(f"Radar Time: {frame_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
 
+        # The base map is identical for every frame, so dragging the slider only
+        # swaps the radar overlay instead of re-creating the map in the browser
         radar_map = create_radar_map(
             center_lat=st.session_state.radar_lat,
             center_lon=st.session_state.radar_lon,
             zoom=radar_zoom,
-            radar_tile_url=selected_frame["url"],
             selected_lat=st.session_state.radar_lat,
             selected_lon=st.session_state.radar_lon,
+            layer_control=False,
         )
 
+        # The layer control is passed alongside the overlay so it lists "Radar"
         map_data = st_folium(
             radar_map,
             width=None,
             height=600,
+            feature_group_to_add=create_radar_overlay(frame_url),
+            layer_control=folium.LayerControl(),
             key="radar_map_display",
         )
 
@@ -388,6 +553,10 @@ with tab4:
             clicked = map_data["last_clicked"]
             st.session_state.radar_lat = clicked["lat"]
             st.session_state.radar_lon = clicked["lng"]
-            st.rerun()
+            st.rerun(scope="fragment")
     else:
         st.info("Click 'Load Radar' to view radar imagery. You can then click on the map to recenter.")
+
+
+with tab4:
+    radar_tab()
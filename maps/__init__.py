@@ -3,6 +3,9 @@ from .weather_maps import (
     create_forecast_map,
     create_location_picker_map,
     create_radar_map,
+    create_radar_overlay,
+    get_alerts_map_html,
+    render_map_html,
 )
 
 __all__ = [
@@ -10,4 +13,7 @@ __all__ = [
     "create_forecast_map",
     "create_location_picker_map",
     "create_radar_map",
+    "create_radar_overlay",
+    "get_alerts_map_html",
+    "render_map_html",
 ]
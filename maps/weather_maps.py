@@ -1,4 +1,37 @@
-import folium
+from __future__ import annotations
+
+import base64
+import hashlib
+import html
+import io
+import string
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import orjson
+from shapely.geometry import mapping, shape
+
+if TYPE_CHECKING:
+    import folium
+
+
+@cache
+def _folium():
+    """
+    Import folium on first use.
+
+    folium pulls in branca, jinja2 and dozens of submodules, so importing this
+    package stays cheap until a map is actually built.
+    """
+    import folium
+
+    return folium
+
 
 # US state center coordinates for default map views
 STATE_CENTERS = {
@@ -54,6 +87,33 @@ STATE_CENTERS = {
     "WY": (42.755966, -107.302490),
 }
 
+# Center of the contiguous US, used when a state code is not recognised
+DEFAULT_CENTER = (39.8283, -98.5795)
+
+# Flat (lat, lon) buffer indexed by the two letters of a state code, so a
+# lookup is two array reads instead of a dict hash; unused slots hold NaN
+_CENTERS = array("d", [float("nan")] * 2 * 26 * 26)
+for _code, (_lat, _lon) in STATE_CENTERS.items():
+    _index = (ord(_code[0]) - 65) * 26 + ord(_code[1]) - 65
+    _CENTERS[2 * _index] = _lat
+    _CENTERS[2 * _index + 1] = _lon
+del _code, _lat, _lon, _index
+
+
+def _state_center(state_code: str) -> tuple[float, float]:
+    """Return the map center for a state code, or DEFAULT_CENTER if unknown."""
+    if len(state_code) != 2:
+        return DEFAULT_CENTER
+    row, col = ord(state_code[0]) - 65, ord(state_code[1]) - 65
+    if not (0 <= row < 26 and 0 <= col < 26):
+        return DEFAULT_CENTER
+    index = 2 * (row * 26 + col)
+    lat = _CENTERS[index]
+    if lat != lat:  # NaN marks a code with no state
+        return DEFAULT_CENTER
+    return lat, _CENTERS[index + 1]
+
+
 SEVERITY_COLORS = {
     "Extreme": "#FF0000",
     "Severe": "#FF6600",
@@ -62,11 +122,349 @@ SEVERITY_COLORS = {
     "Unknown": "#808080",
 }
 
+# Alert polygon styles, built once per severity instead of once per alert
+_STYLE_DICTS = {
+    severity: {"fillColor": color, "color": color, "weight": 2, "fillOpacity": 0.4}
+    for severity, color in SEVERITY_COLORS.items()
+}
+
+
+# Alert polygons above this many vertices are simplified before being rasterized,
+# to about half a pixel at the raster's zoom; the clickable vector layer is shown
+# zoomed in past that and always keeps the full-resolution geometry
+SIMPLIFY_MIN_VERTICES = 200
+
+
+def _vertex_count(geometry: dict) -> int:
+    """Count the vertices of a GeoJSON Polygon or MultiPolygon."""
+    if geometry["type"] == "Polygon":
+        return sum(len(ring) for ring in geometry["coordinates"])
+    return sum(len(ring) for polygon in geometry["coordinates"] for ring in polygon)
+
+
+def _simplify(geometry: dict, tolerance: float) -> dict:
+    """Douglas-Peucker simplify a large polygon, keeping small ones untouched."""
+    if _vertex_count(geometry) <= SIMPLIFY_MIN_VERTICES:
+        return geometry
+    simplified = shape(geometry).simplify(tolerance, preserve_topology=False)
+    if simplified.is_empty:
+        return geometry
+    return mapping(simplified)
+
+
+_CARTO_ATTRIBUTION = (
+    '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors '
+    '&copy; <a href="https://carto.com/attributions">CARTO</a>'
+)
+
+# Basemaps used by the factories, spelled out so folium never has to resolve a
+# tile name against the full xyzservices provider registry on each map
+_TILES = {
+    "CartoDB positron": {
+        "name": "CartoDB.Positron",
+        "url": "https://{s}.basemaps.cartocdn.com/light_all/{z}/{x}/{y}{r}.png",
+        "attr": _CARTO_ATTRIBUTION,
+    },
+    "CartoDB dark_matter": {
+        "name": "CartoDB.DarkMatter",
+        "url": "https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png",
+        "attr": _CARTO_ATTRIBUTION,
+    },
+}
+
+
+@cache
+def _tile_provider(tiles: str):
+    """Build the xyzservices provider for a basemap in _TILES once."""
+    import xyzservices
+
+    spec = _TILES[tiles]
+    return xyzservices.TileProvider(
+        name=spec["name"],
+        url=spec["url"],
+        attribution=spec["attr"],
+        html_attribution=spec["attr"],
+        subdomains="abcd",
+        max_zoom=20,
+    )
+
+
+def _tiles(tiles: str):
+    """Resolve a known basemap name to its prebuilt provider; pass anything else through."""
+    return _tile_provider(tiles) if tiles in _TILES else tiles
+
+
+# Marker icon options shared by the map factories
+_ICON_OPTIONS = {
+    "alert": {"color": "red", "icon": "exclamation-triangle", "prefix": "fa"},
+    "forecast": {"color": "blue", "icon": "cloud", "prefix": "fa"},
+    "crosshair": {"color": "red", "icon": "crosshairs", "prefix": "fa"},
+}
+
+
+# Alerts map zoom, and how many 256px tile-widths around the center count as
+# "in view" for culling (generous, so alerts just off-screen survive a pan)
+ALERTS_MAP_ZOOM = 6
+VIEW_TILE_SPAN = 3
+
+_OFFSCREEN_BADGE = (
+    '<div style="position: fixed; bottom: 24px; left: 12px; z-index: 1000; padding: 4px 8px; '
+    'background: rgba(255, 255, 255, 0.85); border-radius: 4px; font: 12px sans-serif;">'
+    "{count} alert(s) outside this view not drawn</div>"
+).format
+
+
+def _view_bbox(center: tuple[float, float], zoom: int) -> tuple[float, float, float, float]:
+    """Approximate (min_lon, min_lat, max_lon, max_lat) around a center at a zoom level."""
+    half_extent = VIEW_TILE_SPAN * 360.0 / 2**zoom
+    lat, lon = center
+    return lon - half_extent, lat - half_extent, lon + half_extent, lat + half_extent
+
+
+def _geometry_bbox(geometry: dict) -> tuple[float, float, float, float]:
+    """Bounding box of a GeoJSON Polygon or MultiPolygon from its outer rings."""
+    if geometry["type"] == "Polygon":
+        outer_rings = [geometry["coordinates"][0]]
+    else:
+        outer_rings = [polygon[0] for polygon in geometry["coordinates"]]
+    coords = np.concatenate([np.asarray(ring, dtype=np.float64)[:, :2] for ring in outer_rings])
+    min_lon, min_lat = coords.min(axis=0)
+    max_lon, max_lat = coords.max(axis=0)
+    return float(min_lon), float(min_lat), float(max_lon), float(max_lat)
+
+
+# Alert fields shown in popups, built on click by GeoJsonPopup from feature properties
+_POPUP_FIELDS = ["event", "severity", "areaDesc"]
+_POPUP_ALIASES = ["Event:", "Severity:", "Area:"]
+
+# Coordinate popups use %-formatting, which skips float.__format__ dispatch
+_FORECAST_POPUP = "<b>Forecast Location</b><br>Lat: %.4f<br>Lon: %.4f".__mod__
+_SELECTED_POPUP = "Selected: %.4f, %.4f".__mod__
+
+
+def _alert_style(feature: dict) -> dict:
+    """Look up the shared style for an alert feature by its severity."""
+    return _STYLE_DICTS.get(feature["properties"]["severity"], _STYLE_DICTS["Unknown"])
+
+
+_POLYGON_TYPES = frozenset(("Polygon", "MultiPolygon"))
+
+
+@dataclass(slots=True)
+class _Alert:
+    """The parts of an NWS alert feature the alerts map uses, escaped for HTML."""
+
+    event: str
+    severity: str
+    area: str
+    geometry: dict | None
+
+
+def _parse_alert(alert: dict) -> _Alert:
+    """Read an NWS alert feature into an _Alert in one pass over its properties."""
+    props = alert.get("properties", {})
+    geometry = alert.get("geometry")
+
+    return _Alert(
+        event=html.escape(props.get("event", "Unknown Event")),
+        severity=html.escape(props.get("severity", "Unknown")),
+        area=html.escape(props.get("areaDesc", "Unknown Area")),
+        geometry=geometry if geometry and geometry.get("type") in _POLYGON_TYPES else None,
+    )
+
+
+def _alerts_in_view(alerts: list[_Alert], view: tuple[float, float, float, float]) -> tuple[list[_Alert], int]:
+    """
+    Drop polygon alerts whose bounding box misses the view.
+
+    All polygon bounding boxes are stacked into one array and tested against
+    the view in a single vectorized interval check. Alerts without a polygon
+    are kept.
+
+    Returns:
+        Tuple of (alerts to draw in their original order, number culled)
+    """
+    polygon_indices = [index for index, alert in enumerate(alerts) if alert.geometry is not None]
+    if not polygon_indices:
+        return alerts, 0
+
+    min_x, min_y, max_x, max_y = view
+    bounds = np.array([_geometry_bbox(alerts[index].geometry) for index in polygon_indices])
+    in_view = (bounds[:, 0] <= max_x) & (bounds[:, 2] >= min_x) & (bounds[:, 1] <= max_y) & (bounds[:, 3] >= min_y)
+    visible = {index for index, hit in zip(polygon_indices, in_view.tolist()) if hit}
+
+    culled = len(polygon_indices) - len(visible)
+    if not culled:
+        return alerts, 0
+
+    kept = [alert for index, alert in enumerate(alerts) if alert.geometry is None or index in visible]
+    return kept, culled
+
+
+def _prepare_alerts(alerts: list[dict], center: tuple[float, float]) -> tuple[list[dict], list[dict], int]:
+    """
+    Split alerts into polygon features and marker points for an alerts map.
+
+    Returns:
+        Tuple of (polygon GeoJSON features, point GeoJSON features at the map
+        center for alerts without a polygon, number of polygons culled as
+        outside the view)
+    """
+    parsed, offscreen = _alerts_in_view(list(map(_parse_alert, alerts)), _view_bbox(center, ALERTS_MAP_ZOOM))
+
+    point = {"type": "Point", "coordinates": [center[1], center[0]]}
+    features = []
+    markers = []
+
+    for alert in parsed:
+        # Only the fields shown in the popup are embedded in the page
+        properties = {"event": alert.event, "severity": alert.severity, "areaDesc": alert.area}
+        if alert.geometry is not None:
+            features.append(
+                {
+                    "type": "Feature",
+                    "id": str(len(features)),
+                    "geometry": alert.geometry,
+                    "properties": properties,
+                }
+            )
+        else:
+            markers.append({"type": "Feature", "id": str(len(markers)), "geometry": point, "properties": properties})
+
+    return features, markers, offscreen
+
+
+# Above this many polygons in view, alerts are drawn as one pre-rendered image
+# instead of vector paths at ALERTS_MAP_ZOOM and below (the raster matches the
+# map's pixels at that zoom); zooming in swaps back to the clickable vector layer
+RASTER_MIN_FEATURES = 50
+_MAX_MERCATOR_LAT = 85.0511
+
+
+def _mercator_y(lat: np.ndarray | float) -> np.ndarray | float:
+    """Web Mercator y (in radians) for a latitude in degrees."""
+    return np.log(np.tan(np.pi / 4 + np.radians(lat) / 2))
+
+
+def _rasterize_features(
+    features: list[dict], view: tuple[float, float, float, float], zoom: int
+) -> tuple[str, list[list[float]]]:
+    """
+    Draw alert polygons into a transparent PNG covering the view.
+
+    The image is laid out in Web Mercator at one pixel per screen pixel for the
+    given zoom, so Leaflet can stretch it over the view bounds without distortion.
+    Fill and outline colors follow the same per-severity styles as the vector layer.
+
+    Returns:
+        Tuple of (PNG data URL, [[south, west], [north, east]] image bounds)
+    """
+    from PIL import Image, ImageDraw
+
+    west, south, east, north = view
+    south = max(south, -_MAX_MERCATOR_LAT)
+    north = min(north, _MAX_MERCATOR_LAT)
+    y_north, y_south = _mercator_y(north), _mercator_y(south)
+
+    world_px = 256 * 2**zoom
+    width = max(1, round((east - west) / 360 * world_px))
+    height = max(1, round((y_north - y_south) / (2 * np.pi) * world_px))
+    # Half a pixel in degrees, narrowed by Mercator's stretch at the view's
+    # highest latitude so the error stays within half a pixel vertically too
+    tolerance = 180 / world_px * np.cos(np.radians(max(abs(south), abs(north))))
+
+    def to_pixels(ring: list) -> np.ndarray:
+        coords = np.asarray(ring, dtype=np.float64)[:, :2]
+        x = (coords[:, 0] - west) / (east - west) * width
+        lat = np.clip(coords[:, 1], -_MAX_MERCATOR_LAT, _MAX_MERCATOR_LAT)
+        y = (y_north - _mercator_y(lat)) / (y_north - y_south) * height
+        return np.column_stack((x, y))
+
+    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+
+    for feature in features:
+        geometry = _simplify(feature["geometry"], tolerance)
+        polygons = [geometry["coordinates"]] if geometry["type"] == "Polygon" else geometry["coordinates"]
+        rings = [[to_pixels(ring) for ring in polygon] for polygon in polygons]
+
+        # Work in the feature's own pixel box to keep each mask small
+        outer = np.concatenate([polygon[0] for polygon in rings])
+        x0, y0 = np.floor(outer.min(axis=0)).astype(int) - 2
+        x1, y1 = np.ceil(outer.max(axis=0)).astype(int) + 2
+        x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, width), min(y1, height)
+        if x0 >= x1 or y0 >= y1:
+            continue
+
+        style = _alert_style(feature)
+        fill_alpha = round(255 * style["fillOpacity"])
+        mask = Image.new("L", (x1 - x0, y1 - y0), 0)
+        draw = ImageDraw.Draw(mask)
+        for polygon in rings:
+            shifted = [[tuple(point) for point in ring - (x0, y0)] for ring in polygon]
+            draw.polygon(shifted[0], fill=fill_alpha)
+            for hole in shifted[1:]:
+                draw.polygon(hole, fill=0)
+            for ring in shifted:
+                draw.line(ring, fill=255, width=style["weight"])
+
+        color = tuple(int(style["color"][i : i + 2], 16) for i in (1, 3, 5))
+        layer = Image.new("RGBA", mask.size, color + (0,))
+        layer.putalpha(mask)
+        box = (x0, y0, x1, y1)
+        image.paste(Image.alpha_composite(image.crop(box), layer), box)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=False)
+    data_url = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+    return data_url, [[south, west], [north, east]]
+
+
+@cache
+def _zoom_switch_template():
+    """Compile the script that swaps the raster and vector alert layers on zoom."""
+    from folium.template import Template
+
+    return Template(
+        """
+        {% macro script(this, kwargs) %}
+        (function () {
+            function sync() {
+                if ({{ this.map_name }}.getZoom() > {{ this.max_raster_zoom }}) {
+                    {{ this.map_name }}.removeLayer({{ this.raster_name }});
+                    {{ this.map_name }}.addLayer({{ this.vector_name }});
+                } else {
+                    {{ this.map_name }}.removeLayer({{ this.vector_name }});
+                    {{ this.map_name }}.addLayer({{ this.raster_name }});
+                }
+            }
+            {{ this.map_name }}.on("zoomend", sync);
+            sync();
+        })();
+        {% endmacro %}
+        """
+    )
+
+
+def _zoom_switch(m: folium.Map, raster: folium.Layer, vector: folium.Layer) -> folium.MacroElement:
+    """Show the raster up to ALERTS_MAP_ZOOM and the vector layer when zoomed in further."""
+    switch = _folium().MacroElement()
+    switch._template = _zoom_switch_template()
+    switch.map_name = m.get_name()
+    switch.raster_name = raster.get_name()
+    switch.vector_name = vector.get_name()
+    switch.max_raster_zoom = ALERTS_MAP_ZOOM
+    return switch
+
 
 def create_alerts_map(alerts: list[dict], state_code: str) -> folium.Map:
     """
     Create a Folium map displaying weather alerts as GeoJSON polygons.
 
+    All polygon alerts are drawn by a single GeoJson layer and all alerts
+    without a geometry share one marker group, so the browser builds at most
+    two Leaflet layers regardless of how many alerts are active. Polygons far
+    outside the state view are not drawn; a badge reports how many were skipped.
+
     Args:
         alerts: List of alert features from NWS API (GeoJSON features)
         state_code: Two-letter state code for centering the map
@@ -74,43 +472,208 @@ def create_alerts_map(alerts: list[dict], state_code: str) -> folium.Map:
     Returns:
         Folium Map object
     """
-    center = STATE_CENTERS.get(state_code, (39.8283, -98.5795))
-    m = folium.Map(location=center, zoom_start=6, tiles="CartoDB positron")
+    folium = _folium()
+
+    center = _state_center(state_code)
+    m = folium.Map(location=center, zoom_start=ALERTS_MAP_ZOOM, tiles=_tiles("CartoDB positron"))
+    features, markers, offscreen = _prepare_alerts(alerts, center)
+
+    if features:
+        dense = len(features) > RASTER_MIN_FEATURES
+        vector = folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            name="Alerts",
+            style_function=_alert_style,
+            popup=folium.GeoJsonPopup(fields=_POPUP_FIELDS, aliases=_POPUP_ALIASES, max_width=300),
+            show=not dense,
+        ).add_to(m)
 
-    for alert in alerts:
-        props = alert.get("properties", {})
-        geometry = alert.get("geometry")
+        if dense:
+            image_url, bounds = _rasterize_features(features, _view_bbox(center, ALERTS_MAP_ZOOM), ALERTS_MAP_ZOOM)
+            raster = folium.raster_layers.ImageOverlay(image=image_url, bounds=bounds, name="Alerts (raster)")
+            raster.add_to(m)
+            _zoom_switch(m, raster, vector).add_to(m)
+
+    if markers:
+        # One point layer sharing a single marker template and popup binding
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": markers},
+            name="Alerts without area",
+            control=False,
+            marker=folium.Marker(icon=folium.Icon(**_ICON_OPTIONS["alert"])),
+            popup=folium.GeoJsonPopup(fields=_POPUP_FIELDS, aliases=_POPUP_ALIASES, max_width=300),
+        ).add_to(m)
 
-        severity = props.get("severity", "Unknown")
-        color = SEVERITY_COLORS.get(severity, "#808080")
-        event = props.get("event", "Unknown Event")
-        area = props.get("areaDesc", "Unknown Area")
+    if offscreen:
+        m.get_root().html.add_child(folium.Element(_OFFSCREEN_BADGE(count=offscreen)))
 
-        popup_html = f"""
-        <b>{event}</b><br>
-        <b>Severity:</b> {severity}<br>
-        <b>Area:</b> {area}
-        """
+    return m
 
-        if geometry and geometry.get("type") in ["Polygon", "MultiPolygon"]:
-            folium.GeoJson(
-                geometry,
-                style_function=lambda x, c=color: {
-                    "fillColor": c,
-                    "color": c,
-                    "weight": 2,
-                    "fillOpacity": 0.4,
-                },
-                popup=folium.Popup(popup_html, max_width=300),
-            ).add_to(m)
-        else:
-            folium.Marker(
-                location=center,
-                popup=folium.Popup(popup_html, max_width=300),
-                icon=folium.Icon(color="red", icon="exclamation-triangle", prefix="fa"),
-            ).add_to(m)
 
-    return m
+# When set, get_alerts_map_html fills _LEAFLET_TMPL directly instead of building
+# and rendering a folium element tree; create_alerts_map is the fallback
+FAST_ALERTS_HTML = True
+
+# Standalone Leaflet page for the alerts map; the same layers create_alerts_map
+# builds through folium, with the data spliced in as pre-escaped JSON
+_LEAFLET_TMPL = string.Template(
+    """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css">
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/Leaflet.awesome-markers/2.0.2/leaflet.awesome-markers.css">
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@6.2.0/css/all.min.css">
+<script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js"></script>
+<script src="https://cdnjs.cloudflare.com/ajax/libs/Leaflet.awesome-markers/2.0.2/leaflet.awesome-markers.js"></script>
+<style>html, body, #map { width: 100%; height: 100%; margin: 0; padding: 0; }</style>
+</head>
+<body>
+<div id="map"></div>
+$badge
+<script>
+var map = L.map("map").setView($center, $zoom);
+L.tileLayer($tiles, {attribution: $attribution, subdomains: "abcd", maxZoom: 20}).addTo(map);
+var styles = $styles;
+function bindAlertPopup(feature, layer) {
+    var p = feature.properties;
+    layer.bindPopup(
+        "<b>" + p.event + "</b><br><b>Severity:</b> " + p.severity + "<br><b>Area:</b> " + p.areaDesc,
+        {maxWidth: 300}
+    );
+}
+var alertsLayer = L.geoJson($features, {
+    style: function (feature) { return styles[feature.properties.severity] || styles.Unknown; },
+    onEachFeature: bindAlertPopup
+});
+var raster = $raster;
+if (raster) {
+    // Dense alert sets: the raster up to the state zoom, clickable vectors past it
+    var rasterLayer = L.imageOverlay(raster[0], raster[1]);
+    var syncAlertLayers = function () {
+        if (map.getZoom() > $zoom) {
+            map.removeLayer(rasterLayer);
+            map.addLayer(alertsLayer);
+        } else {
+            map.removeLayer(alertsLayer);
+            map.addLayer(rasterLayer);
+        }
+    };
+    map.on("zoomend", syncAlertLayers);
+    syncAlertLayers();
+} else {
+    alertsLayer.addTo(map);
+}
+var alertIcon = L.AwesomeMarkers.icon($icon);
+L.geoJson($markers, {
+    pointToLayer: function (feature, latlng) { return L.marker(latlng, {icon: alertIcon}); },
+    onEachFeature: bindAlertPopup
+}).addTo(map);
+</script>
+</body>
+</html>
+"""
+)
+
+
+def _script_json(obj: Any) -> str:
+    """Encode a value for inline <script> use, escaping HTML-significant characters."""
+    return (
+        orjson.dumps(obj)
+        .decode()
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+        .replace("'", "\\u0027")
+    )
+
+
+def _render_alerts_html(alerts: list[dict], state_code: str) -> str:
+    """Render the alerts map page straight from _LEAFLET_TMPL, without folium."""
+    center = _state_center(state_code)
+    features, markers, offscreen = _prepare_alerts(alerts, center)
+
+    raster = None
+    if len(features) > RASTER_MIN_FEATURES:
+        raster = _rasterize_features(features, _view_bbox(center, ALERTS_MAP_ZOOM), ALERTS_MAP_ZOOM)
+
+    return _LEAFLET_TMPL.substitute(
+        badge=_OFFSCREEN_BADGE(count=offscreen) if offscreen else "",
+        center=_script_json(center),
+        zoom=ALERTS_MAP_ZOOM,
+        tiles=_script_json(_TILES["CartoDB positron"]["url"]),
+        attribution=_script_json(_TILES["CartoDB positron"]["attr"]),
+        styles=_script_json(_STYLE_DICTS),
+        features=_script_json({"type": "FeatureCollection", "features": features}),
+        icon=_script_json({"markerColor": "red", "iconColor": "white", "icon": "exclamation-triangle", "prefix": "fa"}),
+        markers=_script_json({"type": "FeatureCollection", "features": markers}),
+        raster=_script_json(raster),
+    )
+
+
+def render_map_html(m: folium.Map) -> str:
+    """
+    Render a folium map to a standalone HTML document.
+
+    This renders the map's root figure directly rather than going through
+    Map._repr_html_, which renders the same page and then wraps it in a
+    base64-encoded iframe for notebooks.
+
+    Args:
+        m: Folium Map object
+
+    Returns:
+        HTML document for the map
+    """
+    return m.get_root().render()
+
+
+# Rendered alerts map HTML keyed by (state code, rendering path, digest of the
+# alerts payload).
+# Keyed on a digest rather than the payload itself so large polygon sets are not
+# kept alive by the cache; guarded by a lock since Streamlit serves sessions
+# from several threads.
+ALERTS_HTML_CACHE_SIZE = 32
+_alerts_html_cache: OrderedDict[tuple[str, bool, bytes], str] = OrderedDict()
+_alerts_html_lock = threading.Lock()
+
+
+def get_alerts_map_html(state_code: str, alerts: list[dict]) -> str:
+    """
+    Return the rendered HTML page for an alerts map, reusing earlier renders.
+
+    Identical alert payloads for the same state skip folium and Jinja entirely.
+    Use create_alerts_map when the live folium.Map object is needed.
+
+    Args:
+        state_code: Two-letter state code for centering the map
+        alerts: List of alert features from NWS API (GeoJSON features)
+
+    Returns:
+        Standalone HTML document for the map
+    """
+    fast = FAST_ALERTS_HTML
+    payload = orjson.dumps(alerts, option=orjson.OPT_SORT_KEYS)
+    key = (state_code, fast, hashlib.blake2b(payload, digest_size=16).digest())
+
+    with _alerts_html_lock:
+        cached = _alerts_html_cache.get(key)
+        if cached is not None:
+            _alerts_html_cache.move_to_end(key)
+            return cached
+
+    if fast:
+        rendered = _render_alerts_html(alerts, state_code)
+    else:
+        rendered = render_map_html(create_alerts_map(alerts, state_code))
+
+    with _alerts_html_lock:
+        _alerts_html_cache[key] = rendered
+        _alerts_html_cache.move_to_end(key)
+        while len(_alerts_html_cache) > ALERTS_HTML_CACHE_SIZE:
+            _alerts_html_cache.popitem(last=False)
+    return rendered
 
 
 def create_forecast_map(
@@ -127,9 +690,11 @@ def create_forecast_map(
     Returns:
         Folium Map object
     """
-    m = folium.Map(location=[latitude, longitude], zoom_start=10, tiles="CartoDB positron")
+    folium = _folium()
+
+    m = folium.Map(location=[latitude, longitude], zoom_start=10, tiles=_tiles("CartoDB positron"))
 
-    popup_html = f"<b>Forecast Location</b><br>Lat: {latitude:.4f}<br>Lon: {longitude:.4f}"
+    popup_html = _FORECAST_POPUP((latitude, longitude))
 
     if forecast_data and len(forecast_data) > 0:
         first_period = forecast_data[0]
@@ -142,7 +707,7 @@ def create_forecast_map(
     folium.Marker(
         location=[latitude, longitude],
         popup=folium.Popup(popup_html, max_width=300),
-        icon=folium.Icon(color="blue", icon="cloud", prefix="fa"),
+        icon=folium.Icon(**_ICON_OPTIONS["forecast"]),
     ).add_to(m)
 
     return m
@@ -170,22 +735,38 @@ def create_location_picker_map(
     Returns:
         Folium Map object that captures click events
     """
+    folium = _folium()
+
     m = folium.Map(
         location=[center_lat, center_lon],
         zoom_start=zoom,
-        tiles=tiles,
+        tiles=_tiles(tiles),
     )
 
     if selected_lat is not None and selected_lon is not None:
         folium.Marker(
             location=[selected_lat, selected_lon],
-            popup=f"Selected: {selected_lat:.4f}, {selected_lon:.4f}",
-            icon=folium.Icon(color="red", icon="crosshairs", prefix="fa"),
+            popup=_SELECTED_POPUP((selected_lat, selected_lon)),
+            icon=folium.Icon(**_ICON_OPTIONS["crosshair"]),
         ).add_to(m)
 
     return m
 
 
+def _radar_tile_layer(radar_tile_url: str) -> folium.TileLayer:
+    """Build the semi-transparent RainViewer tile layer."""
+    folium = _folium()
+
+    return folium.TileLayer(
+        tiles=radar_tile_url,
+        attr="RainViewer",
+        name="Radar",
+        overlay=True,
+        control=True,
+        opacity=0.7,
+    )
+
+
 def create_radar_map(
     center_lat: float = 39.8283,
     center_lon: float = -98.5795,
@@ -193,6 +774,7 @@ def create_radar_map(
     radar_tile_url: str | None = None,
     selected_lat: float | None = None,
     selected_lon: float | None = None,
+    layer_control: bool = True,
 ) -> folium.Map:
     """
     Create a Folium map with optional radar overlay.
@@ -204,33 +786,51 @@ def create_radar_map(
         radar_tile_url: RainViewer tile URL template
         selected_lat: Selected point latitude (shows marker)
         selected_lon: Selected point longitude (shows marker)
+        layer_control: Add a layer control; pass False when overlays are added
+            later (e.g. through st_folium), so the control is built with them
 
     Returns:
         Folium Map object with radar overlay
     """
+    folium = _folium()
+
     m = folium.Map(
         location=[center_lat, center_lon],
         zoom_start=zoom,
-        tiles="CartoDB dark_matter",
+        tiles=_tiles("CartoDB dark_matter"),
     )
 
     if radar_tile_url:
-        folium.TileLayer(
-            tiles=radar_tile_url,
-            attr="RainViewer",
-            name="Radar",
-            overlay=True,
-            control=True,
-            opacity=0.7,
-        ).add_to(m)
+        _radar_tile_layer(radar_tile_url).add_to(m)
 
     if selected_lat is not None and selected_lon is not None:
         folium.Marker(
             location=[selected_lat, selected_lon],
-            popup=f"Selected: {selected_lat:.4f}, {selected_lon:.4f}",
-            icon=folium.Icon(color="red", icon="crosshairs", prefix="fa"),
+            popup=_SELECTED_POPUP((selected_lat, selected_lon)),
+            icon=folium.Icon(**_ICON_OPTIONS["crosshair"]),
         ).add_to(m)
 
-    folium.LayerControl().add_to(m)
+    if layer_control:
+        folium.LayerControl().add_to(m)
 
     return m
+
+
+def create_radar_overlay(radar_tile_url: str) -> folium.FeatureGroup:
+    """
+    Create a feature group holding only the radar tile layer.
+
+    Passing this to st_folium's feature_group_to_add swaps the radar frame on an
+    already rendered map instead of rebuilding the whole map in the browser.
+
+    Args:
+        radar_tile_url: RainViewer tile URL template
+
+    Returns:
+        Folium FeatureGroup containing the radar overlay
+    """
+    folium = _folium()
+
+    overlay = folium.FeatureGroup(name="Radar")
+    _radar_tile_layer(radar_tile_url).add_to(overlay)
+    return overlay
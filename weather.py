@@ -1,15 +1,16 @@
 from typing import Any
 
-import httpx
+import orjson
 from mcp.server.fastmcp import FastMCP
 
+from api import get_client
+
 #  Initialize FastMCP application
 mcp = FastMCP("weather")
 
 # Constants
 
 NWS_API_BASE = "https://api.weather.gov"
-USER_AGENT = "weather-app/1.0" 
 
 """
 The FastMCP class usees Python type hints and docstrings to automatically generate tool definitions, making it easy to create and maintain MCP tools.
@@ -26,14 +27,14 @@ Next, let's add our helper funlctions for querying and formatting the data from
 
 async def make_nws_request(url: str) -> dict[str, Any] | None:
     """Make a request to the NWS API with proper error handling."""
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/geo+json"}
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except Exception:
-            return None
+    headers = {"Accept": "application/geo+json"}
+    client = get_client()
+    try:
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except Exception:
+        return None
 
 
 def format_alert(feature: dict) -> str: